@@ -9,15 +9,21 @@ This script handles:
 
 Usage:
     python resume-tailor.py preprocess --jd <jd_path> --resume <resume_path> --corpus <corpus_path> --output <output_path>
-    python resume-tailor.py validate --edits <edits_json> --corpus <corpus_path> --output <output_path>
+    python resume-tailor.py validate --edits <edits_json|edits_jsonl> --corpus <corpus_path> --output <output_path>
 """
 
 import argparse
+import bisect
 import json
+import os
 import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate, islice
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
-from typing import List, Set, Dict, Optional, Tuple
+from dataclasses import dataclass, fields, is_dataclass, replace
+from typing import List, Set, FrozenSet, Dict, Iterator, Optional, Tuple
 
 # ============================================================================
 # CONFIGURATION
@@ -38,8 +44,12 @@ CHAR_LIMIT_ONE_LINE = CHAR_LIMITS['bullet_one_line']
 CHAR_LIMIT_TWO_LINE = CHAR_LIMITS['bullet_two_line']
 CHAR_LIMIT_AWKWARD = CHAR_LIMITS['bullet_awkward']
 
+# Edit batches at least this large are validated across worker processes on
+# multi-CPU machines (estimated 2-CPU break-even under spawn: up to ~14k edits)
+PARALLEL_VALIDATION_MIN_EDITS = 15000
+
 # Common PM/tech keywords to look for
-INDUSTRY_TERMS = {
+INDUSTRY_TERMS = frozenset({
     # Strategy & Leadership
     "product strategy", "product vision", "roadmap", "strategic", "vision",
     "go-to-market", "gtm", "product-led growth", "plg", "north star",
@@ -78,10 +88,53 @@ INDUSTRY_TERMS = {
     # Domains
     "fintech", "healthtech", "automotive", "enterprise", "consumer",
     "e-commerce", "ecommerce", "web3", "blockchain",
-}
+})
+
+# Keyword categories, checked in this order (first match wins)
+_STRATEGY_TERMS = frozenset({
+    "product strategy", "product vision", "roadmap", "strategic", "vision",
+    "go-to-market", "gtm", "north star", "product-market fit", "pmf",
+})
+_AI_ML_TERMS = frozenset({
+    "ai", "ml", "machine learning", "artificial intelligence", "deep learning",
+    "nlp", "natural language processing", "llm", "large language model",
+    "genai", "generative ai", "agentic", "autonomous", "intelligent",
+    "recommendation", "recommender", "predictive", "computer vision",
+})
+_OUTCOME_TERMS = frozenset({
+    "growth", "acquisition", "retention", "engagement", "conversion",
+    "arr", "revenue", "arpu", "ltv", "cltv", "churn", "nps",
+    "adoption", "activation",
+})
+_METHODOLOGY_TERMS = frozenset({
+    "agile", "scrum", "lean", "kanban", "design thinking",
+    "a/b testing", "ab testing", "experimentation", "jtbd",
+})
+_LEADERSHIP_TERMS = frozenset({
+    "cross-functional", "stakeholder", "executive", "leadership",
+    "team management", "mentorship", "coaching", "collaboration",
+    "high-performing", "building teams", "scaling teams",
+})
+_DOMAIN_TERMS = frozenset({
+    "fintech", "healthtech", "automotive", "enterprise", "consumer",
+    "e-commerce", "ecommerce", "web3", "blockchain", "saas", "b2b", "b2c",
+})
+
+# term -> category lookup; anything not listed is a "skill"
+_TERM_CATEGORY: Dict[str, str] = {}
+for _category, _terms in (
+    ("strategy", _STRATEGY_TERMS),
+    ("ai_ml", _AI_ML_TERMS),
+    ("outcome", _OUTCOME_TERMS),
+    ("methodology", _METHODOLOGY_TERMS),
+    ("leadership", _LEADERSHIP_TERMS),
+    ("domain", _DOMAIN_TERMS),
+):
+    for _term in _terms:
+        _TERM_CATEGORY.setdefault(_term, _category)
 
 # Stopwords to ignore in validation
-STOPWORDS = {
+STOPWORDS = frozenset({
     'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
     'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
@@ -95,46 +148,71 @@ STOPWORDS = {
     'new', 'first', 'last', 'long', 'great', 'little', 'own', 'well',
     'back', 'way', 'even', 'still', 'here', 'there', 'then', 'can', 'any',
     'about', 'across', 'within', 'including', 'led', 'leading', 'using',
-}
+})
+
+# Precompiled patterns (used per line / per bullet / per edit)
+_RE_YEARS = re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience')
+_RE_SECONDARY_MARKER = re.compile(r'preferred|nice to have')
+# Dollar amounts, or a digit run followed by %, x or + (one branch, not three)
+_RE_METRICS = re.compile(r'\$[\d.,]+[MBK]?|\d+[%x+]')
+_RE_WORDS = re.compile(r'\b[\w-]+\b')
+# Same tokens as _RE_WORDS, minus those of 1-2 characters
+_RE_SIG_WORDS = re.compile(r'\b[\w-]{3,}\b')
+# Capitalized word runs; same matches as \b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b, but
+# leading with [A-Z] (boundary checked by the lookbehind) lets re skip ahead
+# to candidate capitals instead of testing \b at every position
+_RE_CAPS = re.compile(r'[A-Z](?<!\w[A-Z])[a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_RE_BULLET_PREFIX = re.compile(r'^[•\-\t\s]+')
+_RE_BULLET_LINE = re.compile(r'^[^\S\n]*[•\-][•\-\t ]*(.*)$', re.M)
+# Whitespace in the date range never spans lines, so this can scan a whole section
+_RE_DATE_RANGE = re.compile(r'(19|20)\d{2}[^\S\n]*[-–][^\S\n]*(19|20)?\d{2}|Present')
+_RE_COLUMN_SPLIT = re.compile(r'\t|\s{2,}')
+_RE_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+_RE_LABEL = re.compile(r'^(.+?(?::|–)\s)')
+_RE_CONTACT_NUM = re.compile(r'^[\d\-\.\(\)\s]+$')
+_RE_SEPARATORS = re.compile(r'[|–\-•:]')
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Keyword:
     term: str
     category: str  # skill, responsibility, tool, outcome, methodology, domain
     importance: str  # primary, secondary
     source_context: str  # snippet from JD where it appeared
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Bullet:
     id: str
     text: str
     char_count: int
     company: str
-    metrics: List[str] = field(default_factory=list)
+    metrics: Tuple[str, ...] = ()
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GapAnalysis:
     keyword: str
     category: str
     importance: str
     status: str  # explicit, missing
-    match_locations: List[str] = field(default_factory=list)
+    match_locations: Tuple[str, ...] = ()
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     bullet_id: str
     original: str
     proposed: str
     keyword_added: str
     char_count: int
-    warnings: List[str] = field(default_factory=list)
+    warnings: Tuple[str, ...] = ()
     passed: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ResumeSummary:
     """The summary section at the top of the resume."""
     tagline: str           # "Product Strategy & Innovation | Leading..."
@@ -146,7 +224,7 @@ class ResumeSummary:
         self.tagline_char_count = len(self.tagline)
         self.body_char_count = len(self.body)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CareerHighlight:
     """A career highlight bullet (typically has a label: description format)."""
     id: str
@@ -154,9 +232,9 @@ class CareerHighlight:
     text: str              # The achievement text after the label
     full_text: str         # Complete text including label
     char_count: int
-    metrics: List[str] = field(default_factory=list)
+    metrics: Tuple[str, ...] = ()
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedResume:
     """Complete parsed resume with all sections."""
     summary: ResumeSummary
@@ -164,6 +242,79 @@ class ParsedResume:
     experience_bullets: List[Bullet]
     raw_text: str = ""
 
+# ============================================================================
+# FILE INPUT
+# ============================================================================
+
+@lru_cache(maxsize=16)
+def _read_text_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding='utf-8')
+
+def read_text_file(path: str) -> str:
+    """Read a UTF-8 text file.
+
+    Cached per file; re-read only when its mtime or size changes.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _read_text_file_cached(path, stat.st_mtime_ns, stat.st_size)
+
+# ============================================================================
+# TERM MATCHING
+# ============================================================================
+
+def _trie_pattern(terms) -> str:
+    """Build a regex alternation for terms, factored into a prefix trie."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A term ending here makes the longer continuations optional
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+class TermMatcher:
+    """Find every occurrence of a fixed set of terms in one pass over the text.
+
+    Aho-Corasick style multi-pattern matching on the stdlib `re` engine: the
+    terms are compiled into a single trie-shaped pattern inside a lookahead,
+    so overlapping hits are reported exactly as a `term in text` check per
+    term would find them. Callers pass already-lowercased text.
+    """
+
+    def __init__(self, terms):
+        self.terms = frozenset(t for t in terms if t)
+        self._pattern = re.compile('(?=(' + _trie_pattern(self.terms) + '))')
+        # The pattern reports the longest term at each position; shorter
+        # terms that are prefixes of it start at the same position.
+        self._prefixes = {
+            term: sorted((t for t in self.terms if term.startswith(t)), key=len)
+            for term in self.terms
+        }
+
+    def finditer(self, text: str):
+        """Yield (start_index, term) for every term occurrence, in text order."""
+        if not self.terms:
+            return
+        for m in self._pattern.finditer(text):
+            idx = m.start()
+            for term in self._prefixes[m.group(1)]:
+                yield idx, term
+
+@lru_cache(maxsize=32)
+def _term_matcher(terms: FrozenSet[str]) -> TermMatcher:
+    """Shared TermMatcher per term set, so each set's pattern is compiled once."""
+    return TermMatcher(terms)
+
 # ============================================================================
 # KEYWORD EXTRACTION
 # ============================================================================
@@ -172,34 +323,48 @@ def extract_keywords(jd_text: str) -> List[Keyword]:
     """Extract keywords from job description using pattern matching."""
     keywords = []
     jd_lower = jd_text.lower()
-    seen_terms = set()
 
-    # Find industry terms
+    # A term is secondary when a "preferred"/"nice to have" marker sits in
+    # the 100 chars before it. Markers don't overlap, so their start and end
+    # offsets are both ascending and can be searched with bisect.
+    marker_starts = []
+    marker_ends = []
+    for m in _RE_SECONDARY_MARKER.finditer(jd_lower):
+        marker_starts.append(m.start())
+        marker_ends.append(m.end())
+
+    # Find industry terms: first occurrence of each, reported in JD order
+    # (a shorter term starting at the same offset comes first). One C-level
+    # str.find per term beats a compiled multi-term regex at JD sizes.
+    hits = []
     for term in INDUSTRY_TERMS:
-        if term in jd_lower and term not in seen_terms:
-            # Find context (surrounding text)
-            idx = jd_lower.find(term)
-            start = max(0, idx - 50)
-            end = min(len(jd_lower), idx + len(term) + 50)
-            context = jd_text[start:end].strip()
-
-            # Determine importance based on section
-            importance = "primary"
-            if "preferred" in jd_lower[max(0,idx-100):idx].lower():
-                importance = "secondary"
-            if "nice to have" in jd_lower[max(0,idx-100):idx].lower():
-                importance = "secondary"
-
-            keywords.append(Keyword(
-                term=term,
-                category=categorize_keyword(term),
-                importance=importance,
-                source_context=context
-            ))
-            seen_terms.add(term)
+        idx = jd_lower.find(term)
+        if idx != -1:
+            hits.append((idx, len(term), term))
+    hits.sort()
+
+    for idx, _, term in hits:
+        # Find context (surrounding text)
+        start = max(0, idx - 50)
+        end = min(len(jd_lower), idx + len(term) + 50)
+        context = jd_text[start:end].strip()
+
+        # Determine importance based on section
+        # (the last marker ending at or before idx is the nearest one)
+        importance = "primary"
+        marker_idx = bisect.bisect_right(marker_ends, idx)
+        if marker_idx and marker_starts[marker_idx - 1] >= idx - 100:
+            importance = "secondary"
+
+        keywords.append(Keyword(
+            term=term,
+            category=categorize_keyword(term),
+            importance=importance,
+            source_context=context
+        ))
 
     # Extract years of experience requirements
-    exp_matches = re.findall(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', jd_lower)
+    exp_matches = _RE_YEARS.findall(jd_lower)
     for years in exp_matches:
         keywords.append(Keyword(
             term=f"{years}+ years experience",
@@ -212,37 +377,7 @@ def extract_keywords(jd_text: str) -> List[Keyword]:
 
 def categorize_keyword(term: str) -> str:
     """Categorize keyword by type."""
-    strategy = {"product strategy", "product vision", "roadmap", "strategic", "vision",
-                "go-to-market", "gtm", "north star", "product-market fit", "pmf"}
-    ai_ml = {"ai", "ml", "machine learning", "artificial intelligence", "deep learning",
-             "nlp", "natural language processing", "llm", "large language model",
-             "genai", "generative ai", "agentic", "autonomous", "intelligent",
-             "recommendation", "recommender", "predictive", "computer vision"}
-    outcomes = {"growth", "acquisition", "retention", "engagement", "conversion",
-                "arr", "revenue", "arpu", "ltv", "cltv", "churn", "nps",
-                "adoption", "activation"}
-    methodology = {"agile", "scrum", "lean", "kanban", "design thinking",
-                   "a/b testing", "ab testing", "experimentation", "jtbd"}
-    leadership = {"cross-functional", "stakeholder", "executive", "leadership",
-                  "team management", "mentorship", "coaching", "collaboration",
-                  "high-performing", "building teams", "scaling teams"}
-    domain = {"fintech", "healthtech", "automotive", "enterprise", "consumer",
-              "e-commerce", "ecommerce", "web3", "blockchain", "saas", "b2b", "b2c"}
-
-    if term in strategy:
-        return "strategy"
-    elif term in ai_ml:
-        return "ai_ml"
-    elif term in outcomes:
-        return "outcome"
-    elif term in methodology:
-        return "methodology"
-    elif term in leadership:
-        return "leadership"
-    elif term in domain:
-        return "domain"
-    else:
-        return "skill"
+    return _TERM_CATEGORY.get(term, "skill")
 
 # ============================================================================
 # RESUME PARSING
@@ -287,10 +422,10 @@ def parse_summary_section(summary_text: str) -> ResumeSummary:
     content_lines = []
     for line in lines:
         # Skip if looks like contact info
-        if '@' in line or 'linkedin' in line.lower() or re.match(r'^[\d\-\.\(\)\s]+$', line):
+        if '@' in line or 'linkedin' in line.lower() or _RE_CONTACT_NUM.match(line):
             continue
         # Skip if it's just a name (short, no special chars except spaces)
-        if len(line) < 30 and not any(c in line for c in ['|', '–', '-', '•', ':']):
+        if len(line) < 30 and not _RE_SEPARATORS.search(line):
             continue
         content_lines.append(line)
 
@@ -309,89 +444,102 @@ def parse_summary_section(summary_text: str) -> ResumeSummary:
 
     return ResumeSummary(tagline=tagline, body=body)
 
+def _bullet_text(bullet_match: re.Match) -> str:
+    """Text of a _RE_BULLET_LINE match with bullet markers and padding removed."""
+    text = bullet_match.group(1)
+    # The line pattern already consumed leading bullets, tabs and spaces;
+    # only other whitespace (e.g. NBSP) can hide further bullet characters
+    if text[:1].isspace():
+        text = _RE_BULLET_PREFIX.sub('', text)
+    return text.strip()
+
 def parse_highlights_section(highlights_text: str) -> List[CareerHighlight]:
     """Parse career highlights section."""
     highlights = []
-    lines = highlights_text.split('\n')
     highlight_count = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line:
+    # Bullet lines (starting with • or -), found in one scan of the section
+    for bullet_match in _RE_BULLET_LINE.finditer(highlights_text):
+        full_text = _bullet_text(bullet_match)
+        if len(full_text) < 20:
             continue
 
-        # Detect bullet points
-        if line.startswith('•') or line.startswith('-') or line.startswith('\t•'):
-            full_text = re.sub(r'^[•\-\t\s]+', '', line).strip()
-            if len(full_text) < 20:
-                continue
-
-            # Try to split on label pattern (Label: description or Label – description)
-            # Allow hyphens within labels (e.g., "Cross-Functional Leadership:")
-            label = ''
-            text = full_text
-            # Match up to first colon or en-dash followed by a space
-            label_match = re.match(r'^(.+?(?::|–)\s)', full_text)
-            if label_match:
-                label = label_match.group(1).strip()
-                text = full_text[len(label_match.group(1)):].strip()
-
-            metrics = re.findall(r'\$[\d.,]+[MBK]?|\d+%|\d+x|\d+\+', full_text)
-
-            highlights.append(CareerHighlight(
-                id=f"highlight_{highlight_count}",
-                label=label,
-                text=text,
-                full_text=full_text,
-                char_count=len(full_text),
-                metrics=metrics
-            ))
-            highlight_count += 1
+        # Try to split on label pattern (Label: description or Label – description)
+        # Allow hyphens within labels (e.g., "Cross-Functional Leadership:")
+        label = ''
+        text = full_text
+        # Match up to first colon or en-dash followed by a space
+        label_match = _RE_LABEL.match(full_text)
+        if label_match:
+            label = label_match.group(1).strip()
+            text = full_text[len(label_match.group(1)):].strip()
+
+        metrics = _RE_METRICS.findall(full_text)
+
+        highlights.append(CareerHighlight(
+            id=f"highlight_{highlight_count}",
+            label=label,
+            text=text,
+            full_text=full_text,
+            char_count=len(full_text),
+            metrics=tuple(metrics)
+        ))
+        highlight_count += 1
 
     return highlights
 
 def parse_experience_bullets(experience_text: str) -> List[Bullet]:
     """Parse experience section into bullets (original logic)."""
     bullets = []
-    lines = experience_text.split('\n')
-    current_company = "unknown"
     bullet_count = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line:
+    # Detect company headers (heuristic: line contains a date range).
+    # Record each header line's start offset and the company it names.
+    header_starts = []
+    header_companies = []
+    for date_match in _RE_DATE_RANGE.finditer(experience_text):
+        line_start = experience_text.rfind('\n', 0, date_match.start()) + 1
+        if header_starts and header_starts[-1] == line_start:
             continue
-
-        # Detect company headers (heuristic: contains date range)
-        if re.search(r'(19|20)\d{2}\s*[-–]\s*(19|20)?\d{2}|Present', line):
-            parts = re.split(r'\t|\s{2,}', line)
-            if parts:
-                current_company = parts[0].strip()[:30]
+        line_end = experience_text.find('\n', date_match.end())
+        if line_end == -1:
+            line_end = len(experience_text)
+        line = experience_text[line_start:line_end].strip()
+        header_starts.append(line_start)
+        header_companies.append(_RE_COLUMN_SPLIT.split(line)[0].strip()[:30])
+
+    # Detect bullet points; each belongs to the closest header above it
+    for bullet_match in _RE_BULLET_LINE.finditer(experience_text):
+        header_idx = bisect.bisect_right(header_starts, bullet_match.start())
+        if header_idx and header_starts[header_idx - 1] == bullet_match.start():
+            continue  # a bullet-style line with a date range is a header
+        current_company = header_companies[header_idx - 1] if header_idx else "unknown"
+
+        bullet_text = _bullet_text(bullet_match)
+        if len(bullet_text) < 20:
             continue
 
-        # Detect bullet points
-        if line.startswith('•') or line.startswith('-') or line.startswith('\t•'):
-            bullet_text = re.sub(r'^[•\-\t\s]+', '', line).strip()
-            if len(bullet_text) < 20:
-                continue
-
-            metrics = re.findall(r'\$[\d.,]+[MBK]?|\d+%|\d+x|\d+\+', bullet_text)
-            company_clean = re.sub(r'[^a-zA-Z0-9]', '_', current_company.lower())[:20]
-            bullet_id = f"{company_clean}_{bullet_count}"
-            bullet_count += 1
-
-            bullets.append(Bullet(
-                id=bullet_id,
-                text=bullet_text,
-                char_count=len(bullet_text),
-                company=current_company,
-                metrics=metrics
-            ))
+        metrics = _RE_METRICS.findall(bullet_text)
+        company_clean = _RE_NON_ALNUM.sub('_', current_company.lower())[:20]
+        bullet_id = f"{company_clean}_{bullet_count}"
+        bullet_count += 1
+
+        bullets.append(Bullet(
+            id=bullet_id,
+            text=bullet_text,
+            char_count=len(bullet_text),
+            company=current_company,
+            metrics=tuple(metrics)
+        ))
 
     return bullets
 
+@lru_cache(maxsize=8)
 def parse_resume(resume_text: str) -> ParsedResume:
-    """Parse resume into structured sections."""
+    """Parse resume into structured sections.
+
+    Memoized on the resume text; treat the returned object as read-only.
+    """
     sections = split_into_sections(resume_text)
 
     summary = parse_summary_section(sections.get('summary', ''))
@@ -418,37 +566,74 @@ def parse_resume_bullets_only(resume_text: str) -> List[Bullet]:
             company="highlights",
             metrics=h.metrics
         ))
-    all_bullets.extend(parsed.experience_bullets)
+    # Copies: parse_resume is memoized, and its bullets must not be
+    # changed through the list handed back here
+    all_bullets.extend(replace(b) for b in parsed.experience_bullets)
     return all_bullets
 
 # ============================================================================
 # GAP ANALYSIS
 # ============================================================================
 
+def _line_index(text: str) -> Tuple[Tuple[str, ...], List[int], str]:
+    """Split text into lines once and index where each line starts.
+
+    Returns (lines, line_starts, text_lower). line_starts holds the offset
+    of each line in text_lower (lowercasing can change a line's length, so
+    offsets refer to the lowercased text), so a match offset maps to its
+    line with bisect.
+    """
+    lines = tuple(text.split('\n'))
+    text_lower = text.lower()
+    line_starts = list(accumulate((len(line) + 1 for line in text_lower.split('\n')),
+                                  initial=0))[:-1]
+    return lines, line_starts, text_lower
+
+@lru_cache(maxsize=2)
+def _cached_line_index(text: str) -> Tuple[Tuple[str, ...], List[int], str]:
+    """_line_index for find_explicit_matches, which callers run once per keyword."""
+    return _line_index(text)
+
 def find_explicit_matches(keyword: str, text: str) -> List[str]:
     """Find all explicit matches of a keyword in text."""
-    matches = []
-    text_lower = text.lower()
     keyword_lower = keyword.lower()
+    if '\n' in keyword_lower:
+        return []
+    lines, line_starts, text_lower = _cached_line_index(text)
 
-    # Direct match
-    if keyword_lower in text_lower:
-        # Find the line containing the match
-        for line in text.split('\n'):
-            if keyword_lower in line.lower():
-                matches.append(line.strip()[:100])
-
+    # Direct match: the lines containing the keyword. After a hit, the
+    # search resumes at the next line so each line is reported once.
+    matches = []
+    pos = text_lower.find(keyword_lower)
+    while pos != -1:
+        line_idx = bisect.bisect_right(line_starts, pos) - 1
+        matches.append(lines[line_idx].strip()[:100])
+        if line_idx + 1 == len(line_starts):
+            break
+        pos = text_lower.find(keyword_lower, line_starts[line_idx + 1])
     return matches
 
 def compute_gap_analysis(keywords: List[Keyword], resume_text: str, corpus_text: str) -> List[GapAnalysis]:
     """Determine which keywords are covered or missing."""
     gaps = []
 
-    # Combine resume and corpus for matching
-    combined_text = resume_text + "\n" + corpus_text
+    # Index keyword hits with one matcher pass over each whole text, rather
+    # than rescanning it once per keyword. Each hit offset is mapped to its
+    # line through the line-start table; a term is recorded once per line.
+    # Resume lines come first, then corpus lines.
+    matcher = _term_matcher(frozenset(kw.term.lower() for kw in keywords))
+    matches_by_term = defaultdict(list)
+    for text in (resume_text, corpus_text):
+        lines, line_starts, text_lower = _line_index(text)
+        last_line_by_term = {}
+        for pos, term in matcher.finditer(text_lower):
+            line_idx = bisect.bisect_right(line_starts, pos) - 1
+            if last_line_by_term.get(term) != line_idx:
+                last_line_by_term[term] = line_idx
+                matches_by_term[term].append(lines[line_idx].strip()[:100])
 
     for kw in keywords:
-        matches = find_explicit_matches(kw.term, combined_text)
+        matches = matches_by_term.get(kw.term.lower(), [])
 
         status = "explicit" if matches else "missing"
 
@@ -457,7 +642,7 @@ def compute_gap_analysis(keywords: List[Keyword], resume_text: str, corpus_text:
             category=kw.category,
             importance=kw.importance,
             status=status,
-            match_locations=matches[:3]  # Limit to 3 examples
+            match_locations=tuple(matches[:3])  # Limit to 3 examples
         ))
 
     return gaps
@@ -466,18 +651,54 @@ def compute_gap_analysis(keywords: List[Keyword], resume_text: str, corpus_text:
 # VALIDATION
 # ============================================================================
 
-def load_corpus_words(corpus_path: str) -> Set[str]:
-    """Load all words from the bullet corpus."""
-    with open(corpus_path, 'r') as f:
-        text = f.read().lower()
+@lru_cache(maxsize=8)
+def _load_corpus_words_cached(corpus_path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    # Extract all words (keep hyphenated terms together). The file is
+    # tokenized line by line, so no full-text or lowercased copy is held.
+    words = set()
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            words.update(_RE_WORDS.findall(line.lower()))
+    # Also index hyphenated terms in their spaced form, so a multi-word
+    # proper noun ("Product Led") is checked with a single lookup
+    words.update([w.replace('-', ' ') for w in words if '-' in w])
+    return frozenset(words)
+
+def load_corpus_words(corpus_path: str) -> FrozenSet[str]:
+    """Load all words from the bullet corpus.
+
+    Hyphenated words are included a second time with spaces instead of
+    hyphens, for the proper-noun check in validate_edit.
+    Cached per file; the corpus is re-read only when its mtime or size
+    changes (the same rule as read_text_file).
+    """
+    path = os.path.abspath(corpus_path)
+    stat = os.stat(path)
+    return _load_corpus_words_cached(path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4096)
+def extract_metrics(text: str) -> FrozenSet[str]:
+    """Extract all metrics from text.
+
+    Memoized: many edits share the same original bullet.
+    """
+    return frozenset(_RE_METRICS.findall(text))
 
-    # Extract all words (keep hyphenated terms together)
-    words = set(re.findall(r'\b[\w-]+\b', text))
-    return words
+@lru_cache(maxsize=2048)
+def tokenize(text: str) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """Tokenize text for validation.
 
-def extract_metrics(text: str) -> Set[str]:
-    """Extract all metrics from text."""
-    return set(re.findall(r'\$[\d.,]+[MBK]?|\d+%|\d+x|\d+\+', text))
+    Returns (words, metrics, proper_nouns): significant lowercased words
+    (3+ characters, not a number, not a stopword), metric strings, and
+    capitalized word runs, each as a frozenset.
+    Memoized, so an original bullet shared by several edits is scanned once.
+    """
+    words = frozenset([
+        word for word in _RE_SIG_WORDS.findall(text.lower()) if not word.isdigit()
+    ]) - STOPWORDS
+    metrics = frozenset(_RE_METRICS.findall(text))
+    caps = frozenset(_RE_CAPS.findall(text))
+    return words, metrics, caps
 
 def validate_edit(original: str, proposed: str, corpus_words: Set[str],
                   section_type: str = 'bullet') -> Tuple[List[str], bool]:
@@ -486,7 +707,7 @@ def validate_edit(original: str, proposed: str, corpus_words: Set[str],
     Args:
         original: Original text
         proposed: Proposed replacement text
-        corpus_words: Set of all words in the bullet corpus
+        corpus_words: Set of all words in the bullet corpus (from load_corpus_words)
         section_type: One of 'summary_tagline', 'summary_body', 'highlight', 'bullet'
     """
     warnings = []
@@ -524,26 +745,18 @@ def validate_edit(original: str, proposed: str, corpus_words: Set[str],
         elif char_count < CHAR_LIMIT_ONE_LINE[0]:
             warnings.append(f"CHAR_SHORT: {char_count} chars below minimum ({CHAR_LIMIT_ONE_LINE[0]})")
 
+    original_words, original_metrics, original_caps = tokenize(original)
+    proposed_words, proposed_metrics, proposed_caps = tokenize(proposed)
+
     # Check 2: All significant words exist in corpus
-    original_words = set(re.findall(r'\b[\w-]+\b', original.lower()))
-    proposed_words = set(re.findall(r'\b[\w-]+\b', proposed.lower()))
-    new_words = proposed_words - original_words - STOPWORDS
-
-    hallucination_words = []
-    for word in new_words:
-        # Skip numbers and very short words
-        if word.isdigit() or len(word) <= 2:
-            continue
-        if word not in corpus_words:
-            hallucination_words.append(word)
+    # (tokenize already dropped stopwords, numbers and very short words)
+    hallucination_words = list(proposed_words.difference(original_words, corpus_words))
 
     if hallucination_words:
         warnings.append(f"HALLUCINATION_RISK: Words not in corpus: {hallucination_words}")
         passed = False
 
     # Check 3: Metrics preserved
-    original_metrics = extract_metrics(original)
-    proposed_metrics = extract_metrics(proposed)
     lost_metrics = original_metrics - proposed_metrics
 
     if lost_metrics:
@@ -551,45 +764,98 @@ def validate_edit(original: str, proposed: str, corpus_words: Set[str],
         passed = False
 
     # Check 4: No new capitalized words (potential hallucinated proper nouns)
-    original_caps = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', original))
-    proposed_caps = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', proposed))
     new_caps = proposed_caps - original_caps
 
     for cap in new_caps:
-        cap_lower = cap.lower()
-        if cap_lower not in corpus_words and cap_lower.replace(' ', '-') not in corpus_words:
+        # Spaced forms of hyphenated corpus terms are already in corpus_words
+        if cap.lower() not in corpus_words:
             warnings.append(f"NEW_PROPER_NOUN: '{cap}' - verify this exists in your experience")
 
     return warnings, passed
 
+def _validate_edit_entry(edit: dict, corpus_words: FrozenSet[str]) -> Tuple[List[str], bool]:
+    """Run validate_edit on one entry of the edits JSON."""
+    # Get section type for appropriate validation limits
+    section_type = edit.get('section_type', 'bullet')
+
+    return validate_edit(
+        edit['original'],
+        edit['proposed'],
+        corpus_words,
+        section_type=section_type
+    )
+
+# Set once per worker process so the corpus isn't pickled with every task
+_worker_corpus_words: FrozenSet[str] = frozenset()
+
+def _init_validation_worker(corpus_path: str) -> None:
+    # Loaded by path rather than shipped from the parent: a forked worker
+    # inherits the in-memory cache, a spawned one tokenizes the corpus once
+    global _worker_corpus_words
+    _worker_corpus_words = load_corpus_words(corpus_path)
+
+def _validate_edit_in_worker(edit: dict) -> Tuple[List[str], bool]:
+    return _validate_edit_entry(edit, _worker_corpus_words)
+
+def iter_edits(edits_path: str) -> Iterator[dict]:
+    """Yield proposed edits from a JSON array file.
+
+    A `.jsonl` file (one edit object per line) is streamed line by line
+    instead of being parsed up front.
+    """
+    with open(edits_path, 'r', encoding='utf-8') as f:
+        if edits_path.endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
 def run_validation(edits_path: str, corpus_path: str) -> List[ValidationResult]:
-    """Validate all proposed edits."""
-    with open(edits_path, 'r') as f:
-        edits = json.load(f)
+    """Validate all proposed edits.
 
+    Edits are consumed in windows of PARALLEL_VALIDATION_MIN_EDITS. On a
+    multi-CPU machine, once a full window arrives the rest of the batch is
+    spread across worker processes; each edit is validated independently.
+    """
     corpus_words = load_corpus_words(corpus_path)
+    edits = iter_edits(edits_path)
     results = []
-
-    for edit in edits:
-        # Get section type for appropriate validation limits
-        section_type = edit.get('section_type', 'bullet')
-
-        warnings, passed = validate_edit(
-            edit['original'],
-            edit['proposed'],
-            corpus_words,
-            section_type=section_type
-        )
-
-        results.append(ValidationResult(
-            bullet_id=edit.get('id', edit.get('bullet_id', 'unknown')),
-            original=edit['original'],
-            proposed=edit['proposed'],
-            keyword_added=edit.get('keyword_added', ''),
-            char_count=len(edit['proposed']),
-            warnings=warnings,
-            passed=passed
-        ))
+    executor = None
+    # With a single CPU a pool only adds pickling and IPC
+    use_pool = (os.cpu_count() or 1) > 1
+
+    try:
+        while True:
+            window = list(islice(edits, PARALLEL_VALIDATION_MIN_EDITS))
+            if not window:
+                break
+
+            if (executor is None and use_pool
+                    and len(window) == PARALLEL_VALIDATION_MIN_EDITS):
+                # Imported here: concurrent.futures.process pulls in
+                # multiprocessing, which every other run can skip
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(initializer=_init_validation_worker,
+                                               initargs=(corpus_path,))
+            if executor is not None:
+                outcomes = executor.map(_validate_edit_in_worker, window, chunksize=32)
+            else:
+                outcomes = (_validate_edit_entry(edit, corpus_words) for edit in window)
+
+            for edit, (warnings, passed) in zip(window, outcomes):
+                results.append(ValidationResult(
+                    bullet_id=edit.get('id', edit.get('bullet_id', 'unknown')),
+                    original=edit['original'],
+                    proposed=edit['proposed'],
+                    keyword_added=edit.get('keyword_added', ''),
+                    char_count=len(edit['proposed']),
+                    warnings=tuple(warnings),
+                    passed=passed
+                ))
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return results
 
@@ -597,6 +863,26 @@ def run_validation(edits_path: str, corpus_path: str) -> List[ValidationResult]:
 # CLI
 # ============================================================================
 
+def _json_default(obj):
+    """Serialize dataclasses shallowly (asdict() would deep-copy every field)."""
+    if is_dataclass(obj):
+        # fields() rather than vars(): slotted instances have no __dict__
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def to_columns(items: list, item_type: type) -> Dict[str, list]:
+    """Convert a list of dataclass instances to one list per field.
+
+    Used for --columnar output: {'id': [...], 'text': [...], ...} repeats
+    each key once instead of once per item.
+    """
+    return {f.name: [getattr(item, f.name) for item in items] for f in fields(item_type)}
+
+def _write_json(path: str, data) -> None:
+    """Encode data in one call and write it with a single write."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, default=_json_default))
+
 def main():
     parser = argparse.ArgumentParser(description='Resume tailoring preprocessing and validation')
     subparsers = parser.add_subparsers(dest='command', required=True)
@@ -607,10 +893,13 @@ def main():
     preprocess.add_argument('--resume', required=True, help='Path to resume')
     preprocess.add_argument('--corpus', required=True, help='Path to bullet corpus')
     preprocess.add_argument('--output', required=True, help='Output JSON path')
+    preprocess.add_argument('--columnar', action='store_true',
+                            help='Write highlights and experience bullets as one list per field')
 
     # Validate command
     validate = subparsers.add_parser('validate', help='Validate proposed edits')
-    validate.add_argument('--edits', required=True, help='Path to proposed edits JSON')
+    validate.add_argument('--edits', required=True,
+                          help='Path to proposed edits JSON (or .jsonl, one edit per line)')
     validate.add_argument('--corpus', required=True, help='Path to bullet corpus')
     validate.add_argument('--output', required=True, help='Output JSON path')
 
@@ -618,12 +907,9 @@ def main():
 
     if args.command == 'preprocess':
         # Load inputs
-        with open(args.jd, 'r') as f:
-            jd_text = f.read()
-        with open(args.resume, 'r') as f:
-            resume_text = f.read()
-        with open(args.corpus, 'r') as f:
-            corpus_text = f.read()
+        jd_text = read_text_file(args.jd)
+        resume_text = read_text_file(args.resume)
+        corpus_text = read_text_file(args.corpus)
 
         # Process
         keywords = extract_keywords(jd_text)
@@ -638,55 +924,89 @@ def main():
 
         gaps.sort(key=gap_sort_key)
 
-        # Compute per-section keyword coverage
-        def keywords_in_text(kws: List[Keyword], text: str) -> Dict[str, str]:
-            """Check which keywords appear in text, return dict of keyword -> status."""
-            text_lower = text.lower()
+        # Compute per-section keyword coverage (one matcher pass per section).
+        # Coverage is kept as a bitmask (bit i set = keywords[i] found) and
+        # only expanded to a keyword -> status dict for the output.
+        coverage_matcher = _term_matcher(frozenset(kw.term.lower() for kw in keywords))
+        term_bits = defaultdict(int)
+        for i, kw in enumerate(keywords):
+            term_bits[kw.term.lower()] |= 1 << i
+
+        def keywords_in_text(text_lower: str) -> int:
+            """Return the bitmask of keywords that appear in (lowercased) text."""
+            mask = 0
+            for _, term in coverage_matcher.finditer(text_lower):
+                mask |= term_bits[term]
+            return mask
+
+        def coverage_to_dict(mask: int) -> Dict[str, str]:
+            """Expand a coverage bitmask to a dict of keyword -> status."""
             result = {}
-            for kw in kws:
-                result[kw.term] = 'found' if kw.term.lower() in text_lower else 'missing'
+            for i, kw in enumerate(keywords):
+                result[kw.term] = 'found' if mask >> i & 1 else 'missing'
             return result
 
-        summary_text = parsed_resume.summary.tagline + ' ' + parsed_resume.summary.body
-        highlights_text = ' '.join(h.full_text for h in parsed_resume.highlights)
-        experience_text = ' '.join(b.text for b in parsed_resume.experience_bullets)
+        # Section texts are lowercased once, as they are built
+        summary_lower = (parsed_resume.summary.tagline + ' ' + parsed_resume.summary.body).lower()
+        highlights_lower = ' '.join(h.full_text for h in parsed_resume.highlights).lower()
+        experience_lower = ' '.join(b.text for b in parsed_resume.experience_bullets).lower()
+        summary_coverage = keywords_in_text(summary_lower)
+        highlights_coverage = keywords_in_text(highlights_lower)
+        experience_coverage = keywords_in_text(experience_lower)
+
+        # Tally gap statuses in a single pass
+        explicit_count = missing_count = missing_primary = missing_secondary = 0
+        for g in gaps:
+            if g.status == 'explicit':
+                explicit_count += 1
+            elif g.status == 'missing':
+                missing_count += 1
+                if g.importance == 'primary':
+                    missing_primary += 1
+                elif g.importance == 'secondary':
+                    missing_secondary += 1
+
+        highlights_out = parsed_resume.highlights
+        bullets_out = parsed_resume.experience_bullets
+        if args.columnar:
+            highlights_out = to_columns(highlights_out, CareerHighlight)
+            bullets_out = to_columns(bullets_out, Bullet)
 
         # Output with section-aware structure
         output = {
             'jd_file': args.jd,
             'resume_file': args.resume,
-            'keywords': [asdict(k) for k in keywords],
+            'keywords': keywords,
             'sections': {
                 'summary': {
                     'tagline': parsed_resume.summary.tagline,
                     'tagline_char_count': parsed_resume.summary.tagline_char_count,
                     'body': parsed_resume.summary.body,
                     'body_char_count': parsed_resume.summary.body_char_count,
-                    'keywords_coverage': keywords_in_text(keywords, summary_text),
+                    'keywords_coverage': coverage_to_dict(summary_coverage),
                 },
                 'highlights': {
-                    'items': [asdict(h) for h in parsed_resume.highlights],
-                    'keywords_coverage': keywords_in_text(keywords, highlights_text),
+                    'items': highlights_out,
+                    'keywords_coverage': coverage_to_dict(highlights_coverage),
                 },
                 'experience': {
-                    'bullets': [asdict(b) for b in parsed_resume.experience_bullets],
-                    'keywords_coverage': keywords_in_text(keywords, experience_text),
+                    'bullets': bullets_out,
+                    'keywords_coverage': coverage_to_dict(experience_coverage),
                 },
             },
-            'gaps': [asdict(g) for g in gaps],
+            'gaps': gaps,
             'summary': {
                 'total_keywords': len(keywords),
-                'explicit_matches': len([g for g in gaps if g.status == 'explicit']),
-                'missing': len([g for g in gaps if g.status == 'missing']),
-                'missing_primary': len([g for g in gaps if g.status == 'missing' and g.importance == 'primary']),
-                'missing_secondary': len([g for g in gaps if g.status == 'missing' and g.importance == 'secondary']),
+                'explicit_matches': explicit_count,
+                'missing': missing_count,
+                'missing_primary': missing_primary,
+                'missing_secondary': missing_secondary,
                 'total_highlights': len(parsed_resume.highlights),
                 'total_experience_bullets': len(parsed_resume.experience_bullets),
             }
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(output, f, indent=2)
+        _write_json(args.output, output)
 
         # Print summary
         print(f"\n{'='*60}")
@@ -712,18 +1032,24 @@ def main():
     elif args.command == 'validate':
         results = run_validation(args.edits, args.corpus)
 
+        # Tally results in a single pass
+        passed_count = warning_count = 0
+        for r in results:
+            if r.passed:
+                passed_count += 1
+            warning_count += len(r.warnings)
+
         output = {
-            'results': [asdict(r) for r in results],
+            'results': results,
             'summary': {
                 'total': len(results),
-                'passed': len([r for r in results if r.passed]),
-                'failed': len([r for r in results if not r.passed]),
-                'warnings': sum(len(r.warnings) for r in results),
+                'passed': passed_count,
+                'failed': len(results) - passed_count,
+                'warnings': warning_count,
             }
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(output, f, indent=2)
+        _write_json(args.output, output)
 
         # Print summary
         print(f"\n{'='*60}")